@@ -1,3 +1,10 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import SearchHistory
+
+
+@admin.register(SearchHistory)
+class SearchHistoryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'company_name', 'searched_at')
+    list_select_related = ('user',)
+    search_fields = ('company_name', 'user__username')
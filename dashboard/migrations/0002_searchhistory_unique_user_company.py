@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-15 21:27
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+def keep_latest_search_per_company(apps, schema_editor):
+    # Only older repeats of a search are dropped; the newest row per company
+    # survives, so reversing the migration leaves the deduplicated rows as-is.
+    SearchHistory = apps.get_model('dashboard', 'SearchHistory')
+    seen = set()
+    stale_ids = []
+    rows = SearchHistory.objects.order_by('user_id', '-searched_at', '-id').values_list(
+        'id', 'user_id', 'company_name'
+    )
+    for row_id, user_id, company_name in rows.iterator():
+        key = (user_id, company_name.lower())
+        if key in seen:
+            stale_ids.append(row_id)
+        else:
+            seen.add(key)
+    SearchHistory.objects.filter(id__in=stale_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_search_per_company, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='searchhistory',
+            constraint=models.UniqueConstraint(models.F('user'), django.db.models.functions.text.Lower('company_name'), name='uniq_user_company'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -14,6 +16,11 @@ class SearchHistory(models.Model):
             models.Index(fields=['user', '-searched_at']),
             models.Index(fields=['company_name']),
         ]
+        constraints = [
+            # One row per user and company (case-insensitive); repeat searches
+            # refresh ``searched_at`` instead of adding rows.
+            models.UniqueConstraint(F('user'), Lower('company_name'), name='uniq_user_company'),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - debug representation
-        return f'{self.user.username}: {self.company_name} at {self.searched_at.isoformat()}'
+        return f'{self.user_id}: {self.company_name} at {self.searched_at.isoformat()}'
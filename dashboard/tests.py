@@ -1,3 +1,103 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from esg import clients
+
+
+class _FakeStream:
+    def __init__(self, text):
+        self.text = text
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __iter__(self):
+        yield SimpleNamespace(type='response.output_text.delta', delta=self.text)
+
+
+class _FakeOpenAI:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.instances.append(self)
+        self.responses = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        if 'tools' in kwargs:
+            payload = {'articles': [{'title': 'Emissions cut', 'url': 'https://example.com/1'}]}
+        else:
+            payload = {'overview': 'Test overview.', 'items': [], 'overall_score': 50}
+        return _FakeStream(json.dumps(payload))
+
+
+@override_settings(OPENAI_API_KEY='test-key')
+class DashboardOpenAIClientTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _FakeOpenAI.instances = []
+        clients._client_for_key.cache_clear()
+        self.addCleanup(clients._client_for_key.cache_clear)
+        for target in ('esg.clients.OpenAI', 'esg.services.OpenAI'):
+            patcher = mock.patch(target, _FakeOpenAI)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(username='analyst', password='secret-pass-123')
+        self.client.force_login(self.user)
+
+    def test_searches_share_one_openai_client(self):
+        for company in ('Acme', 'Globex', 'Initech'):
+            response = self.client.get(reverse('dashboard:home'), {'company': company})
+            self.assertContains(response, 'Test overview.')
+
+        self.assertEqual(len(_FakeOpenAI.instances), 1)
+
+
+class KeepLatestSearchMigrationTests(TransactionTestCase):
+    migrate_from = [('dashboard', '0001_initial')]
+    migrate_to = [('dashboard', '0002_searchhistory_unique_user_company')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        self.addCleanup(self._migrate_to_latest)
+        self.apps = executor.loader.project_state(self.migrate_from).apps
+
+    def _migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def _migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+        return executor.loader.project_state(self.migrate_to).apps
+
+    def test_keeps_newest_row_per_company_case_insensitively(self):
+        UserModel = self.apps.get_model('auth', 'User')
+        SearchHistory = self.apps.get_model('dashboard', 'SearchHistory')
+        user = UserModel.objects.create(username='analyst')
+        other = UserModel.objects.create(username='other')
+        now = timezone.now()
+        for offset, name in enumerate(['APPLE', 'apple', 'Apple']):
+            SearchHistory.objects.create(user=user, company_name=name, searched_at=now - timedelta(days=offset))
+        SearchHistory.objects.create(user=user, company_name='Tesla', searched_at=now)
+        SearchHistory.objects.create(user=other, company_name='apple', searched_at=now - timedelta(days=5))
+
+        SearchHistory = self._migrate().get_model('dashboard', 'SearchHistory')
+
+        rows = SearchHistory.objects.order_by('user__username', 'company_name').values_list(
+            'user__username', 'company_name'
+        )
+        self.assertEqual(list(rows), [('analyst', 'APPLE'), ('analyst', 'Tesla'), ('other', 'apple')])
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 from typing import Any, Dict, Tuple
 
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
@@ -14,19 +16,26 @@ from esg.services import ESGService
 
 logger = logging.getLogger(__name__)
 
+_ESG_SERVICE = ESGService()
 
-def _handle_company_search(user_id: int, company_name: str) -> Tuple[Dict[str, Any], bool]:
-    service = ESGService()
-    result, from_cache = service.get_company_esg_profile(company_name)
-    repository = SearchHistoryRepository()
-    repository.record_search(user_id=user_id, company_name=company_name)
+
+async def _handle_company_search(user_id: int, company_name: str) -> Tuple[Dict[str, Any], bool]:
+    # The service is sync and shares the cached OpenAI client; running it off the
+    # ORM thread lets it overlap with the recent-searches query.
+    result, from_cache = await sync_to_async(_ESG_SERVICE.get_company_esg_profile, thread_sensitive=False)(
+        company_name
+    )
+    await sync_to_async(SearchHistoryRepository.record_search)(user_id=user_id, company_name=company_name)
     return result, from_cache
 
 
 @login_required
-def dashboard_view(request: HttpRequest) -> HttpResponse:
-    repository = SearchHistoryRepository()
-    recent_searches = repository.get_recent_searches(user_id=request.user.id, limit=10)
+async def dashboard_view(request: HttpRequest) -> HttpResponse:
+    user = await request.auser()
+    # The history query runs on the ORM thread while the ESG lookup runs on a worker thread.
+    recent_task = asyncio.create_task(
+        sync_to_async(SearchHistoryRepository.get_recent_searches)(user_id=user.id, limit=10)
+    )
 
     searched_company: str | None = None
 
@@ -42,14 +51,11 @@ def dashboard_view(request: HttpRequest) -> HttpResponse:
         else:
             form = CompanySearchForm()
 
-    context: Dict[str, Any] = {
-        'form': form,
-        'recent_searches': recent_searches,
-    }
+    context: Dict[str, Any] = {'form': form}
 
     if searched_company:
         try:
-            result, from_cache = _handle_company_search(request.user.id, searched_company)
+            result, from_cache = await _handle_company_search(user.id, searched_company)
             context['result'] = result
             context['from_cache'] = from_cache
         except ESGServiceError as exc:
@@ -59,7 +65,9 @@ def dashboard_view(request: HttpRequest) -> HttpResponse:
             logger.exception('Unexpected error while processing company %s', searched_company)
             messages.error(request, 'An unexpected error occurred while processing the request.')
 
-    return render(request, 'dashboard/dashboard.html', context)
+    context['recent_searches'] = await recent_task
+    # Rendering reads the session-backed messages and request.user, which are sync-only.
+    return await sync_to_async(render)(request, 'dashboard/dashboard.html', context)
 
 
 @login_required
@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -11,8 +12,9 @@ from django.conf import settings
 
 from dotenv import load_dotenv
 
+from .exceptions import ExternalAPIError
 from .keywords import ALL_KEYWORDS
-from .utils import deduplicate_articles, safe_parse_datetime, take_latest
+from .utils import deduplicate_articles, json_loads, safe_parse_datetime, take_latest
 
 
 dotenv_path = Path(getattr(settings, 'BASE_DIR', '.')) / '.env'
@@ -34,16 +36,65 @@ logger = logging.getLogger(__name__)
 
 LOOKBACK_DAYS = 730
 
+_KEYWORDS_JOINED = ', '.join(sorted(ALL_KEYWORDS))
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+OPENAI_MAX_RETRIES = 3
+OPENAI_TIMEOUT = 60.0
+
+
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client so pooled connections are reused across requests."""
+    return _client_for_key(settings.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key: str) -> OpenAI:
+    return OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
 
 def fetch_articles(company_name: str, limit: int = 50) -> List[Dict]:
     if not (OpenAI and settings.OPENAI_API_KEY):
         logger.warning('OpenAI is not configured; skipping web search for ESG articles.')
         return []
 
-    keywords = ', '.join(sorted(ALL_KEYWORDS))
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_openai_client()
+
+    try:
+        with client.responses.create(**_web_search_request(company_name, limit), stream=True) as stream:
+            response_text = collect_stream_text(stream)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning('OpenAI web search request failed: %s', exc)
+        return []
+
+    return _articles_from_text(response_text, limit)
+
 
-    system_prompt = (
+def collect_stream_text(events) -> str:
+    """Concatenate the output text of a streamed Responses API call as it arrives.
+
+    Streaming keeps bytes flowing during long generations, so the client read
+    timeout bounds the gap between chunks rather than the whole generation.
+    """
+    chunks: List[str] = []
+    for event in events:
+        _consume_stream_event(event, chunks)
+    return ''.join(chunks)
+
+
+def _consume_stream_event(event, chunks: List[str]) -> None:
+    if event.type == 'response.output_text.delta':
+        chunks.append(event.delta)
+    elif event.type == 'response.failed':
+        raise ExternalAPIError(f'OpenAI response failed: {event.response.error}')
+    elif event.type == 'error':
+        raise ExternalAPIError(f'OpenAI stream error: {event.message}')
+
+
+@lru_cache(maxsize=8)
+def _web_search_system_prompt(limit: int) -> str:
+    return (
         'You are an ESG research assistant. Use the web_search tool to find recent (last 2 years) '
         'news items describing environmental, social, or governance risks involving the requested company. Make the search less strict and retrieve several relevant results. '
         'Return strictly valid JSON with a top-level key "articles" containing a list of objects with '
@@ -51,33 +102,27 @@ def fetch_articles(company_name: str, limit: int = 50) -> List[Dict]:
         'from credible sources. Focus on risk/controversy narratives, not generic corporate press releases.'
     ).format(limit=limit)
 
+
+def _web_search_request(company_name: str, limit: int) -> Dict:
     user_prompt = (
         f"Company: {company_name}\n"
         f"Time horizon: last {LOOKBACK_DAYS} days (approx. 2 years).\n"
-        f"Relevant ESG keywords: {keywords}.\n"
+        f"Relevant ESG keywords: {_KEYWORDS_JOINED}.\n"
         "Provide concise descriptions summarising the ESG risk highlighted by each article."
     )
 
-    try:
-        response = client.responses.create(
-            model=settings.OPENAI_MODEL,
-            input=[
-                {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': user_prompt},
-            ],
-            tools=[{'type': 'web_search'}],
-            max_output_tokens=2000,
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.warning('OpenAI web search request failed: %s', exc)
-        return []
+    return {
+        'model': settings.OPENAI_MODEL,
+        'input': [
+            {'role': 'system', 'content': _web_search_system_prompt(limit)},
+            {'role': 'user', 'content': user_prompt},
+        ],
+        'tools': [{'type': 'web_search'}],
+        'max_output_tokens': 2000,
+    }
 
-    try:
-        response_text = response.output_text
-    except AttributeError:  # pragma: no cover - API change
-        logger.warning('Unexpected response structure from OpenAI web search.')
-        return []
 
+def _articles_from_text(response_text: str, limit: int) -> List[Dict]:
     try:
         payload = _parse_articles_payload(response_text)
     except json.JSONDecodeError as exc:
@@ -86,7 +131,7 @@ def fetch_articles(company_name: str, limit: int = 50) -> List[Dict]:
 
     articles: List[Dict] = []
     for item in payload.get('articles', []):
-        published_at = safe_parse_datetime(item.get('published_at')) or datetime.utcnow()
+        published_at = safe_parse_datetime(item.get('published_at')) or datetime.now(timezone.utc)
         articles.append(
             {
                 'title': item.get('title', ''),
@@ -108,15 +153,15 @@ def _parse_articles_payload(raw_text: str) -> Dict:
 
     # Attempt direct JSON parse
     try:
-        return json.loads(text)
+        return json_loads(text)
     except json.JSONDecodeError:
         pass
 
     # Look for fenced code blocks
-    fenced_blocks = re.findall(r"```(?:json)?\s*(\{.*?\})\s*```", text, flags=re.DOTALL)
+    fenced_blocks = _FENCE_RE.findall(text)
     for block in fenced_blocks:
         try:
-            return json.loads(block)
+            return json_loads(block)
         except json.JSONDecodeError:
             continue
 
@@ -125,7 +170,7 @@ def _parse_articles_payload(raw_text: str) -> Dict:
     end = text.rfind('}')
     if start != -1 and end != -1 and end > start:
         candidate = text[start:end + 1]
-        return json.loads(candidate)
+        return json_loads(candidate)
 
     raise json.JSONDecodeError('Unable to extract JSON object from response.', text, 0)
 
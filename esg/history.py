@@ -1,44 +1,63 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import List
 
+from django.db import close_old_connections, transaction
 from django.utils import timezone
 
 from dashboard.models import SearchHistory
 from .utils import normalize_company_name
 
 
+logger = logging.getLogger(__name__)
+
+# A single worker keeps history writes ordered and off the request thread.
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search-history')
+
+
+def _insert_search(user_id: int, company_label: str, searched_at: datetime) -> None:
+    close_old_connections()
+    try:
+        SearchHistory.objects.update_or_create(
+            user_id=user_id,
+            company_name__iexact=company_label,
+            defaults={'company_name': company_label, 'searched_at': searched_at},
+        )
+    except Exception:  # noqa: BLE001
+        logger.exception('Failed to record search history for user %s', user_id)
+    finally:
+        close_old_connections()
+
+
 class SearchHistoryRepository:
     """Repository for user search history stored in the relational database."""
 
-    def record_search(self, user_id: int, company_name: str) -> None:
+    @staticmethod
+    def record_search(user_id: int, company_name: str) -> None:
+        """Queue the search for the background writer once the current transaction commits.
+
+        Outside an atomic block the write is queued immediately. The request does
+        not wait for it, so write failures are logged rather than raised, and
+        queued writes are lost if the process is killed before the writer drains
+        them (a normal interpreter exit still waits for the queue).
+        """
         if not user_id or not company_name:
             return
         company_label = normalize_company_name(company_name)
-        SearchHistory.objects.create(
-            user_id=user_id,
-            company_name=company_label,
-            searched_at=timezone.now(),
-        )
+        searched_at = timezone.now()
+        transaction.on_commit(lambda: _WRITER.submit(_insert_search, user_id, company_label, searched_at))
 
-    def get_recent_searches(self, user_id: int, limit: int = 10) -> List[dict]:
+    @staticmethod
+    def get_recent_searches(user_id: int, limit: int = 10) -> List[dict]:
         if not user_id:
             return []
-        qs = SearchHistory.objects.filter(user_id=user_id).order_by('-searched_at')
-        seen = set()
-        results: List[dict] = []
-        for entry in qs:
-            key = entry.company_name.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            results.append(
-                {
-                    'company_name': entry.company_name,
-                    'searched_at': entry.searched_at,
-                }
-            )
-            if len(results) >= limit:
-                break
-        return results
-
+        # Rows are unique per company, so the newest rows are already deduplicated.
+        qs = (
+            SearchHistory.objects.filter(user_id=user_id)
+            .order_by('-searched_at')
+            .values('company_name', 'searched_at')[:limit]
+        )
+        return list(qs)
@@ -1,3 +1,9 @@
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
 ENVIRONMENTAL_KEYWORDS = {
     'emission',
     'emissions',
@@ -62,3 +68,20 @@ ESG_KEYWORDS = {
 
 ALL_KEYWORDS = set().union(*ESG_KEYWORDS.values())
 
+
+def _build_automaton(keyword_map):
+    """Compile every keyword into one automaton whose values are the aspects it signals."""
+    if ahocorasick is None:
+        return None
+    aspects_by_keyword = {}
+    for aspect, keywords in keyword_map.items():
+        for keyword in keywords:
+            aspects_by_keyword.setdefault(keyword.lower(), set()).add(aspect)
+    automaton = ahocorasick.Automaton()
+    for keyword, aspects in aspects_by_keyword.items():
+        automaton.add_word(keyword, frozenset(aspects))
+    automaton.make_automaton()
+    return automaton
+
+
+ESG_AUTOMATON = _build_automaton(ESG_KEYWORDS)
@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 from django.conf import settings
 from django.core.cache import cache
 
-from .clients import LOOKBACK_DAYS, fetch_articles
-from .exceptions import ESGServiceError
-from .keywords import ESG_KEYWORDS
+from .clients import LOOKBACK_DAYS, collect_stream_text, fetch_articles, get_openai_client
+from .exceptions import ESGServiceError, ExternalAPIError
+from .keywords import ESG_AUTOMATON, ESG_KEYWORDS
 from .utils import (
     detect_esg_aspects,
     isoformat,
+    json_dumps,
+    json_loads,
+    make_articles_cache_key,
     make_cache_key,
     normalize_company_name,
     safe_parse_datetime,
@@ -33,12 +37,34 @@ WEIGHTS = {
     'social': 3,
     'governance': 3,
 }
+_WEIGHT_SUM = sum(WEIGHTS.values())
+
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@lru_cache(maxsize=1024)
+def _display_date(value: str) -> str:
+    """Render a date string as e.g. 'Mar 05, 2024', or return it unchanged if it does not parse."""
+    # safe_parse_datetime validates the whole string (ISO 8601 via fromisoformat
+    # first), so partial matches such as '2024-03-15 junk' are left as-is.
+    dt = safe_parse_datetime(value)
+    if not dt:
+        return value
+    return f'{_MONTH_ABBR[dt.month - 1]} {dt.day:02d}, {dt.year}'
 
 
 class ESGService:
-    def __init__(self, cache_timeout: int = 60 * 60, max_items: int = 50) -> None:
+    def __init__(
+        self,
+        cache_timeout: int = 60 * 60,
+        max_items: int = 50,
+        articles_cache_timeout: int = 24 * 60 * 60,
+    ) -> None:
         self.cache_timeout = cache_timeout
         self.max_items = max_items
+        # Raw web-search results outlive the derived profile, so prompt or
+        # scoring changes can be re-applied without repeating the search.
+        self.articles_cache_timeout = articles_cache_timeout
 
     def get_company_esg_profile(self, company_name: str) -> Tuple[Dict[str, Any], bool]:
         normalized = normalize_company_name(company_name)
@@ -54,11 +80,13 @@ class ESGService:
     # -----------------------------------------------------------------
 
     def _build_profile(self, company_name: str) -> Dict[str, Any]:
-        overview = self._fetch_company_overview(company_name)
-        articles = fetch_articles(company_name, limit=self.max_items)
+        articles = self._fetch_articles(company_name)
         analysis = self._analyse_articles(company_name, articles)
+        # The OpenAI analysis returns the overview alongside the items; only
+        # the no-articles and heuristic paths need a dedicated overview request.
+        overview = analysis.get('overview') or self._fetch_company_overview(company_name)
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         return {
             'company': company_name,
             'generated_at': isoformat(now),
@@ -70,6 +98,15 @@ class ESGService:
             'search_window_days': LOOKBACK_DAYS,
         }
 
+    def _fetch_articles(self, company_name: str) -> List[Dict]:
+        cache_key = make_articles_cache_key(company_name, LOOKBACK_DAYS, self.max_items)
+        articles = cache.get(cache_key)
+        if articles is None:
+            articles = fetch_articles(company_name, limit=self.max_items)
+            if articles:
+                cache.set(cache_key, articles, timeout=self.articles_cache_timeout)
+        return articles
+
     def _fetch_company_overview(self, company_name: str) -> str:
         if not self._openai_available():
             return (
@@ -100,6 +137,14 @@ class ESGService:
         return self._analyse_with_heuristics(articles)
 
     def _analyse_with_openai(self, company_name: str, articles: List[Dict]) -> Dict[str, Any]:
+        system_prompt, user_prompt = self._combined_profile_prompt(company_name, articles)
+        response_text = self._execute_openai_prompt(
+            user_prompt=user_prompt, system_prompt=system_prompt, json_output=True
+        )
+        return self._parse_analysis(response_text)
+
+    def _combined_profile_prompt(self, company_name: str, articles: List[Dict]) -> Tuple[str, str]:
+        """Prompt for the company overview and the article analysis in a single request."""
         payload = [
             {
                 'title': article.get('title'),
@@ -113,26 +158,36 @@ class ESGService:
 
         system_prompt = (
             "You are an ESG analyst. Analyse the provided news items for "
-            f"{company_name} and return a JSON report with keys 'items' and 'overall_score'. "
-            "Each item must include 'title', 'description', 'date', 'source', 'url', and a 'scores' object "
+            f"{company_name} and return a JSON report with keys 'overview', 'items' and 'overall_score'. "
+            "'overview' is a concise two-sentence overview of the company focusing on its core business, "
+            "scale, and recent strategic priorities. Each item must include 'title', 'description', 'date', 'source', 'url', and a 'scores' object "
             "with numeric values (0-100) for 'environment', 'social', 'governance', and 'overall'."
         )
 
-        user_prompt = "News items JSON:\n" + json.dumps(payload) + "\n\nRespond strictly in JSON."
+        user_prompt = "News items JSON:\n" + json_dumps(payload) + "\n\nRespond strictly in JSON."
+        return system_prompt, user_prompt
 
-        response_text = self._execute_openai_prompt(user_prompt=user_prompt, system_prompt=system_prompt)
+    def _parse_analysis(self, response_text: str) -> Dict[str, Any]:
         try:
-            parsed = json.loads(response_text)
+            parsed = json_loads(response_text)
         except json.JSONDecodeError as exc:
             raise ESGServiceError(f'Failed to parse OpenAI ESG analysis: {exc}') from exc
-
-        items = [self._normalize_item_structure(item) for item in parsed.get('items', [])]
+        # JSON mode guarantees an object, not its schema.
+        if not isinstance(parsed, dict):
+            raise ESGServiceError('OpenAI ESG analysis is not a JSON object.')
+
+        raw_items = parsed.get('items') or []
+        if not isinstance(raw_items, list):
+            raise ESGServiceError('OpenAI ESG analysis items are not a list.')
+        items = [self._normalize_item_structure(item) for item in raw_items if isinstance(item, dict)]
         items = self._sort_items_by_score(items)
         overall_score = parsed.get('overall_score')
         if overall_score is None:
             overall_score = self._compute_overall_score(items)
 
+        overview = parsed.get('overview')
         return {
+            'overview': overview.strip() if isinstance(overview, str) else '',
             'items': items,
             'overall_score': overall_score or 0,
         }
@@ -141,7 +196,7 @@ class ESGService:
         items: List[Dict[str, Any]] = []
         for article in articles:
             text = ' '.join(filter(None, [article.get('title', ''), article.get('description', '')]))
-            aspects = detect_esg_aspects(text, ESG_KEYWORDS)
+            aspects = detect_esg_aspects(text, ESG_KEYWORDS, ESG_AUTOMATON)
             scores = {'environment': 0, 'social': 0, 'governance': 0}
             base_score = 70
             for aspect in aspects:
@@ -204,13 +259,12 @@ class ESGService:
         return round(sum(valid_scores) / len(valid_scores), 2)
 
     def _calculate_weighted_score(self, scores: Dict[str, Any]) -> float:
-        total_weight = sum(WEIGHTS.values())
         weighted_sum = (
             WEIGHTS['environment'] * self._coerce_score(scores.get('environment'))
             + WEIGHTS['social'] * self._coerce_score(scores.get('social'))
             + WEIGHTS['governance'] * self._coerce_score(scores.get('governance'))
         )
-        return round(weighted_sum / total_weight, 2) if total_weight else 0.0
+        return round(weighted_sum / _WEIGHT_SUM, 2) if _WEIGHT_SUM else 0.0
 
     def _coerce_score(self, value: Any, default: float = 0.0) -> float:
         try:
@@ -228,39 +282,39 @@ class ESGService:
 
     def _format_display_date(self, value: Any) -> str:
         if isinstance(value, datetime):
-            dt = value
-        else:
-            dt = safe_parse_datetime(value) if value else None
-        if not dt:
-            return value or 'N/A'
-        return dt.strftime('%b %d, %Y')
+            return value.strftime('%b %d, %Y')
+        if isinstance(value, str) and value:
+            return _display_date(value)
+        return value or 'N/A'
 
     def _openai_available(self) -> bool:
         return bool(OpenAI and settings.OPENAI_API_KEY)
 
-    def _execute_openai_prompt(self, user_prompt: str, system_prompt: str | None = None) -> str:
+    def _execute_openai_prompt(
+        self, user_prompt: str, system_prompt: str | None = None, json_output: bool = False
+    ) -> str:
         if not self._openai_available():
             raise ESGServiceError('OpenAI is not configured.')
 
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        client = get_openai_client()
         messages: List[Dict[str, str]] = []
         if system_prompt:
             messages.append({'role': 'system', 'content': system_prompt})
         messages.append({'role': 'user', 'content': user_prompt})
 
+        options: Dict[str, Any] = {'model': settings.OPENAI_MODEL, 'input': messages}
+        if json_output:
+            # JSON mode guarantees a bare object, so no fence stripping is needed.
+            options['text'] = {'format': {'type': 'json_object'}}
+
         try:
-            response = client.responses.create(
-                model=settings.OPENAI_MODEL,
-                input=messages,
-            )
+            with client.responses.create(**options, stream=True) as stream:
+                return collect_stream_text(stream)
+        except ExternalAPIError:
+            raise
         except Exception as exc:  # noqa: BLE001
             raise ESGServiceError(f'OpenAI request failed: {exc}') from exc
 
-        try:
-            return response.output_text
-        except AttributeError as exc:  # pragma: no cover - API surface change
-            raise ESGServiceError('Unexpected OpenAI response format.') from exc
-
 
 __all__ = ['ESGService']
 
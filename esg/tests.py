@@ -1,3 +1,42 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import TransactionTestCase
 
-# Create your tests here.
+from dashboard.models import SearchHistory
+
+from .history import _WRITER, SearchHistoryRepository
+
+
+class SearchHistoryRepositoryTests(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='analyst', password='secret-pass-123')
+
+    def _record(self, company_name):
+        # Outside an atomic block on_commit runs at once; wait for the queued write.
+        SearchHistoryRepository.record_search(self.user.id, company_name)
+        _WRITER.submit(lambda: None).result()
+
+    def test_record_search_upserts_case_insensitively(self):
+        self._record('Tesla')
+        first = SearchHistoryRepository.get_recent_searches(self.user.id)
+        self._record(' TESLA ')
+
+        recent = SearchHistoryRepository.get_recent_searches(self.user.id)
+        self.assertEqual(len(recent), 1)
+        self.assertGreater(recent[0]['searched_at'], first[0]['searched_at'])
+
+    def test_recent_searches_return_newest_casing_first(self):
+        for company_name in ('tesla', 'Apple', 'TESLA'):
+            self._record(company_name)
+
+        recent = SearchHistoryRepository.get_recent_searches(self.user.id)
+        self.assertEqual([row['company_name'] for row in recent], ['TESLA', 'Apple'])
+
+    def test_record_search_waits_for_the_surrounding_transaction(self):
+        with transaction.atomic():
+            SearchHistoryRepository.record_search(self.user.id, 'Acme')
+            _WRITER.submit(lambda: None).result()
+            self.assertFalse(SearchHistory.objects.exists())
+
+        _WRITER.submit(lambda: None).result()
+        self.assertEqual(list(SearchHistory.objects.values_list('company_name', flat=True)), ['Acme'])
@@ -1,35 +1,69 @@
 from __future__ import annotations
 
 import hashlib
-import re
+import heapq
+import json
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, List, Sequence
 
 try:
     from dateutil import parser
 except ImportError:  # pragma: no cover
     parser = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Sort key for undated articles; aware so it compares with parsed dates.
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
 
 def normalize_company_name(name: str) -> str:
-    return re.sub(r"\s+", " ", name.strip())
+    return " ".join(name.split())
+
+
+def json_loads(text: str | bytes):
+    """Parse JSON with orjson when installed; its decode error subclasses ``json.JSONDecodeError``."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
 
 
 def make_cache_key(company_name: str) -> str:
     normalized = normalize_company_name(company_name).lower()
-    digest = hashlib.sha1(normalized.encode('utf-8'), usedforsecurity=False).hexdigest()  # noqa: S324
+    digest = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
     return f"esg:company:{digest}"
 
 
+def make_articles_cache_key(company_name: str, lookback_days: int, limit: int) -> str:
+    normalized = normalize_company_name(company_name).lower()
+    scope = f"{normalized}|{lookback_days}|{limit}"
+    digest = hashlib.blake2b(scope.encode('utf-8'), digest_size=16).hexdigest()
+    return f"esg:articles:{digest}"
+
+
 def safe_parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
+    # OpenAI is asked for ISO 8601, which fromisoformat parses directly
+    # (including a trailing 'Z'); dateutil only handles the stragglers.
+    try:
+        return ensure_aware(datetime.fromisoformat(value))
+    except (TypeError, ValueError):
+        pass
+    if parser is None:
+        return None
     try:
-        if parser is not None:
-            parsed = parser.parse(value)
-            return ensure_aware(parsed)
-        parsed = datetime.fromisoformat(value)
-        return ensure_aware(parsed)
+        return ensure_aware(parser.parse(value))
     except Exception:
         return None
 
@@ -44,8 +78,19 @@ def isoformat(dt: datetime) -> str:
     return ensure_aware(dt).isoformat()
 
 
-def detect_esg_aspects(text: str, keyword_map: dict[str, Iterable[str]]) -> List[str]:
+def detect_esg_aspects(text: str, keyword_map: dict[str, Iterable[str]], automaton=None) -> List[str]:
+    """Return the aspects of ``keyword_map`` whose keywords occur in ``text``.
+
+    ``automaton`` is an optional precompiled Aho-Corasick automaton for the same
+    map (see ``keywords.ESG_AUTOMATON``); it finds every keyword in a single pass.
+    """
     lowered = text.lower()
+    if automaton is not None:
+        found: set[str] = set()
+        for _, aspects in automaton.iter(lowered):
+            found.update(aspects)
+        return [aspect for aspect in keyword_map if aspect in found]
+
     detected: List[str] = []
     for aspect, keywords in keyword_map.items():
         if any(keyword in lowered for keyword in keywords):
@@ -54,28 +99,15 @@ def detect_esg_aspects(text: str, keyword_map: dict[str, Iterable[str]]) -> List
 
 
 def deduplicate_articles(entries: Sequence[dict]) -> List[dict]:
-    seen: set[str] = set()
-    unique: List[dict] = []
+    """Keep the first entry per URL (or title when the URL is missing)."""
+    by_key: dict[str, dict] = {}
     for entry in entries:
-        key_candidates: Tuple[str | None, ...] = (
-            entry.get('url'),
-            entry.get('title'),
-        )
-        unique_key = next((kc for kc in key_candidates if kc), None)
-        if not unique_key:
-            continue
-        if unique_key in seen:
-            continue
-        seen.add(unique_key)
-        unique.append(entry)
-    return unique
+        unique_key = entry.get('url') or entry.get('title')
+        if unique_key and unique_key not in by_key:
+            by_key[unique_key] = entry
+    return list(by_key.values())
 
 
 def take_latest(entries: Sequence[dict], limit: int) -> List[dict]:
-    sorted_entries = sorted(
-        entries,
-        key=lambda item: item.get('published_at') or datetime.min,
-        reverse=True,
-    )
-    return list(sorted_entries[:limit])
-
+    # Same order as a stable reverse sort, without sorting the whole sequence.
+    return heapq.nlargest(limit, entries, key=lambda item: item.get('published_at') or _OLDEST)
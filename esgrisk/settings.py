@@ -138,14 +138,15 @@ LOGIN_REDIRECT_URL = 'dashboard:home'
 LOGOUT_REDIRECT_URL = 'accounts:login'
 
 
-# Cache configuration for ESG results (LRU with TTL 1 hour)
+# Cache configuration for ESG results (LRU with TTL 1 hour). Each company
+# holds two entries: the profile and its raw web-search articles.
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'esgrisk-cache',
         'TIMEOUT': 60 * 60,
         'OPTIONS': {
-            'MAX_ENTRIES': 10,
+            'MAX_ENTRIES': 20,
         },
     }
 }